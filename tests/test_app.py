@@ -2,92 +2,75 @@
 Tests for the Mergington High School Activities API
 """
 
-import sys
-from pathlib import Path
+from urllib.parse import quote, urlencode
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, app
 
-from app import app
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app"""
+    """Create a test client shared by every test in the module"""
     return TestClient(app)
 
 
+async def call(method, path, query=None):
+    """Invoke the ASGI app directly and return the response status and body"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": quote(path).encode(),
+        "query_string": urlencode(query or {}).encode(),
+        "root_path": "",
+        "headers": [(b"host", b"test")],
+        "client": ("test", 0),
+        "server": ("test", 80),
+    }
+    response = {"status": None, "body": b""}
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response["status"], response["body"]
+
+
+# Snapshot of the initial activities, built once at import. Participants are
+# tuples so the snapshot can never be mutated through the live activities.
+_ORIGINAL_ACTIVITIES = {
+    name: {**details, "participants": tuple(details["participants"])}
+    for name, details in activities.items()
+}
+
+
 @pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    from app import activities
-    
-    # Store original state
-    original_activities = {
-        "Soccer": {
-            "description": "Competitive soccer team and training",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Basketball": {
-            "description": "Basketball league and skills development",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Theater performances and acting workshops",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and sculpture classes",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["grace@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Competitive debate and public speaking",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu", "ava@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Experiments, research projects, and STEM activities",
-            "schedule": "Tuesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 22,
-            "participants": ["mia@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
+    """Restore activities to their initial state after each test"""
     yield
-    
-    # Reset after test
+
+    # Only the participants lists are mutated, so rebuild just those
     activities.clear()
-    activities.update(original_activities)
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    })
 
 
 class TestActivitiesEndpoint:
@@ -123,25 +106,7 @@ class TestSignupEndpoint:
         assert "Signed up newstudent@mergington.edu for Soccer" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert "newstudent@mergington.edu" in activities["Soccer"]["participants"]
-    
-    def test_signup_already_registered_participant(self, client, reset_activities):
-        """Test signing up a participant who is already registered"""
-        response = client.post(
-            "/activities/Soccer/signup?email=alex@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signing up for a non-existent activity"""
-        response = client.post(
-            "/activities/NonexistentActivity/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
 
 
 class TestUnregisterEndpoint:
@@ -158,25 +123,37 @@ class TestUnregisterEndpoint:
         assert "Unregistered alex@mergington.edu from Soccer" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert "alex@mergington.edu" not in activities["Soccer"]["participants"]
-    
-    def test_unregister_nonexistent_participant(self, client, reset_activities):
-        """Test unregistering a participant who is not registered"""
-        response = client.post(
-            "/activities/Soccer/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not registered for this activity" in response.json()["detail"]
-    
-    def test_unregister_from_nonexistent_activity(self, client, reset_activities):
-        """Test unregistering from a non-existent activity"""
-        response = client.post(
-            "/activities/NonexistentActivity/unregister?email=alex@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+
+
+class TestErrorResponses:
+    """Tests for error responses from the signup and unregister endpoints"""
+
+    @pytest.mark.parametrize(
+        "path, email, status, detail",
+        [
+            ("/activities/NonexistentActivity/signup", "newstudent@mergington.edu",
+             404, b"Activity not found"),
+            ("/activities/Soccer/signup", "alex@mergington.edu",
+             400, b"already signed up"),
+            ("/activities/NonexistentActivity/unregister", "alex@mergington.edu",
+             404, b"Activity not found"),
+            ("/activities/Soccer/unregister", "notregistered@mergington.edu",
+             400, b"not registered for this activity"),
+        ],
+        ids=[
+            "signup_missing_activity",
+            "signup_duplicate",
+            "unreg_missing_activity",
+            "unreg_not_registered",
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_error_responses(self, reset_activities, path, email, status, detail):
+        """Test that invalid requests return the expected status and detail"""
+        response_status, body = await call("POST", path, {"email": email})
+        assert response_status == status
+        assert detail in body
 
 
 class TestRootEndpoint:
@@ -201,8 +178,6 @@ class TestIntegration:
         assert signup_response.status_code == 200
         
         # Verify signup
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert "testuser@mergington.edu" in activities["Drama Club"]["participants"]
         initial_count = len(activities["Drama Club"]["participants"])
         
@@ -213,7 +188,5 @@ class TestIntegration:
         assert unregister_response.status_code == 200
         
         # Verify unregister
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert "testuser@mergington.edu" not in activities["Drama Club"]["participants"]
         assert len(activities["Drama Club"]["participants"]) == initial_count - 1